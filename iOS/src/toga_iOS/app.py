@@ -3,6 +3,7 @@ import asyncio
 from rubicon.objc import objc_method
 from rubicon.objc.eventloop import EventLoopPolicy, iOSLifecycle
 
+from toga_iOS.container import reset_bar_heights
 from toga_iOS.libs import UIResponder, UIScreen, av_foundation
 from toga_iOS.window import Window
 
@@ -49,6 +50,9 @@ class PythonAppDelegate(UIResponder):
     ) -> None:
         """This callback is invoked when rotating the device from landscape to portrait
         and vice versa."""
+        # The status bar and navigation bar may have changed size; make sure the
+        # refresh doesn't use stale heights.
+        reset_bar_heights()
         App.app.interface.main_window.content.refresh()
 
 
@@ -1,3 +1,7 @@
+import weakref
+
+from rubicon.objc import objc_method, objc_property, send_super
+
 from .libs import (
     UIApplication,
     UINavigationController,
@@ -14,16 +18,70 @@ from .libs import (
 # and the sizes generated by layout are usable as-is.
 #######################################################################################
 
+# Containers always fill their superview.
+_FLEXIBLE_WIDTH_HEIGHT = int(
+    UIViewAutoresizing.FlexibleWidth | UIViewAutoresizing.FlexibleHeight
+)
+
+# The heights of the status bar and navigation bar are needed on every layout pass,
+# but they only change when the device is rotated (or the bars are otherwise
+# resized). Cache the values; the app discards the caches when the device is rotated,
+# and the navigation controller discards its bar height whenever it is laid out.
+_UNSET = object()
+_status_bar_height = _UNSET
+_root_containers = weakref.WeakSet()
+
+
+def reset_bar_heights():
+    """Discard the cached heights of the status bar and navigation bars."""
+    global _status_bar_height
+    _status_bar_height = _UNSET
+    for container in _root_containers:
+        container._navigation_bar_height = None
+
+
+def status_bar_height():
+    """The current height of the status bar, in points."""
+    global _status_bar_height
+    if _status_bar_height is _UNSET:
+        _status_bar_height = UIApplication.sharedApplication.statusBarFrame.size.height
+    return _status_bar_height
+
+
+class TogaNavigationController(UINavigationController):
+    impl = objc_property(object, weak=True)
+
+    @objc_method
+    def viewDidLayoutSubviews(self) -> None:
+        send_super(__class__, self, "viewDidLayoutSubviews")
+        # The navigation bar may have been resized as part of the layout.
+        if self.impl:  # pragma: no branch
+            self.impl._navigation_bar_height = None
+
+    @objc_method
+    def navigationController_didShowViewController_animated_(
+        self,
+        navigationController,
+        viewController,
+        animated: bool,
+    ) -> None:
+        # Pushing or popping a view controller can change the navigation bar,
+        # and changes the view controller that provides the title.
+        if self.impl:  # pragma: no branch
+            self.impl._navigation_bar_height = None
+            self.impl._title = _UNSET
+
 
 class BaseContainer:
-    def __init__(self, content=None, on_refresh=None):
+    __slots__ = ("_content", "on_refresh", "__weakref__")
+
+    def __init__(self, on_refresh=None):
         """A base class for iOS containers.
 
-        :param content: The widget impl that is the container's initial content.
         :param on_refresh: The callback to be notified when this container's layout is
             refreshed.
         """
-        self._content = content
+        self._content = None
         self.on_refresh = on_refresh
 
     @property
@@ -40,6 +98,10 @@ class BaseContainer:
 
     @content.setter
     def content(self, widget):
+        # Re-assigning the current content is a no-op.
+        if widget is self._content:
+            return
+
         if self.content:
             self._content.container = None
 
@@ -52,9 +114,14 @@ class BaseContainer:
 
 
 class Container(BaseContainer):
-    def __init__(self, content=None, layout_native=None, on_refresh=None):
+    __slots__ = ("native", "layout_native")
+
+    # The vertical offset of content in the container. Only containers with a
+    # navigation bar need to compute an offset.
+    top_offset = 0
+
+    def __init__(self, layout_native=None, on_refresh=None):
         """
-        :param content: The widget impl that is the container's initial content.
         :param layout_native: The native widget that should be used to provide size
             hints to the layout. This will usually be the container widget itself;
             however, for widgets like ScrollContainer where the layout needs to be
@@ -63,12 +130,11 @@ class Container(BaseContainer):
         :param on_refresh: The callback to be notified when this container's layout is
             refreshed.
         """
-        super().__init__(content=content, on_refresh=on_refresh)
+        super().__init__(on_refresh=on_refresh)
         self.native = UIView.alloc().init()
-        self.native.translatesAutoresizingMaskIntoConstraints = True
-        self.native.autoresizingMask = (
-            UIViewAutoresizing.FlexibleWidth | UIViewAutoresizing.FlexibleHeight
-        )
+        # Views created in code already translate their autoresizing mask into
+        # constraints, so only the mask itself needs to be configured.
+        self.native.autoresizingMask = _FLEXIBLE_WIDTH_HEIGHT
 
         self.layout_native = self.native if layout_native is None else layout_native
 
@@ -80,20 +146,14 @@ class Container(BaseContainer):
     def height(self):
         return self.layout_native.bounds.size.height
 
-    @property
-    def top_offset(self):
-        return 0
-
 
 class ControlledContainer(Container):
     def __init__(
         self,
-        content=None,
         layout_native=None,
         on_refresh=None,
     ):
         """
-        :param content: The widget impl that is the container's initial content.
         :param layout_native: The native widget that should be used to provide
             size hints to the layout. This will usually be the container widget
             itself; however, for widgets like ScrollContainer where the layout
@@ -103,14 +163,11 @@ class ControlledContainer(Container):
             refreshed.
         """
         super().__init__(
-            content=content,
             layout_native=layout_native,
             on_refresh=on_refresh,
         )
 
-        # Construct a ViewController that provides a navigation bar, and
-        # is able to maintain a stack of navigable content. This is initialized
-        # with a root UIViewController that is the actual content
+        # Construct a ViewController that presents the content.
         self.controller = UIViewController.alloc().init()
 
         # Set the controller's view to be the root content widget
@@ -118,14 +175,19 @@ class ControlledContainer(Container):
 
 
 class RootContainer(Container):
+    __slots__ = (
+        "content_controller",
+        "controller",
+        "_navigation_bar_height",
+        "_title",
+    )
+
     def __init__(
         self,
-        content=None,
         layout_native=None,
         on_refresh=None,
     ):
         """
-        :param content: The widget impl that is the container's initial content.
         :param layout_native: The native widget that should be used to provide
             size hints to the layout. This will usually be the container widget
             itself; however, for widgets like ScrollContainer where the layout
@@ -135,7 +197,6 @@ class RootContainer(Container):
             refreshed.
         """
         super().__init__(
-            content=content,
             layout_native=layout_native,
             on_refresh=on_refresh,
         )
@@ -144,28 +205,43 @@ class RootContainer(Container):
         # is able to maintain a stack of navigable content. This is initialized
         # with a root UIViewController that is the actual content
         self.content_controller = UIViewController.alloc().init()
-        self.controller = UINavigationController.alloc().initWithRootViewController(
+        self.controller = TogaNavigationController.alloc().initWithRootViewController(
             self.content_controller
         )
+        self.controller.impl = self
+        self.controller.delegate = self.controller
 
         # Set the controller's view to be the root content widget
         self.content_controller.view = self.native
 
+        # The height of the navigation bar is cached; the controller (and
+        # reset_bar_heights()) will discard the cached value whenever the navigation
+        # bar might have changed.
+        self._navigation_bar_height = None
+        self._title = _UNSET
+        _root_containers.add(self)
+
     @property
     def height(self):
         return self.layout_native.bounds.size.height - self.top_offset
 
     @property
     def top_offset(self):
-        return (
-            UIApplication.sharedApplication.statusBarFrame.size.height
-            + self.controller.navigationBar.frame.size.height
-        )
+        if self._navigation_bar_height is None:
+            self._navigation_bar_height = (
+                self.controller.navigationBar.frame.size.height
+            )
+        return status_bar_height() + self._navigation_bar_height
 
     @property
     def title(self):
-        return self.controller.topViewController.title
+        # The title is cached; the controller will discard the cached value if the
+        # top view controller changes.
+        if self._title is _UNSET:
+            self._title = self.controller.topViewController.title
+        return self._title
 
     @title.setter
     def title(self, value):
         self.controller.topViewController.title = value
+        self._title = value
@@ -1,6 +1,6 @@
 import pytest
 
-from toga_iOS.libs import UIApplication, UIWindow
+from toga_iOS.libs import UIApplication, UIViewController, UIWindow
 
 from .probe import BaseProbe
 
@@ -21,14 +21,24 @@ class WindowProbe(BaseProbe):
     def content_size(self):
         # Content height doesn't include the status bar or navigation bar.
         return (
-            self.native.contentView.frame.size.width,
-            self.native.contentView.frame.size.height
+            self.native.rootViewController.view.frame.size.width,
+            self.native.rootViewController.view.frame.size.height
             - (
                 UIApplication.sharedApplication.statusBarFrame.size.height
                 + self.native.rootViewController.navigationBar.frame.size.height
             ),
         )
 
+    async def push_view(self, title):
+        controller = UIViewController.alloc().init()
+        controller.title = title
+        self.native.rootViewController.pushViewController(controller, animated=False)
+        await self.redraw(f"View with title {title!r} has been pushed")
+
+    async def pop_view(self):
+        self.native.rootViewController.popViewControllerAnimated(False)
+        await self.redraw("View has been popped")
+
     async def close_info_dialog(self, dialog):
         self.native.rootViewController.dismissViewControllerAnimated(
             False, completion=None
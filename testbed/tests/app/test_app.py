@@ -57,11 +57,20 @@ if toga.platform.current_platform in {"iOS", "android"}:
         app_probe.terminate()
         await app_probe.redraw("App pre-termination logic has been invoked")
 
-    async def test_device_rotation(app, app_probe):
+    async def test_device_rotation(app, app_probe, main_window, main_window_probe):
         """App responds to device rotation"""
         app_probe.rotate()
         await app_probe.redraw("Device has been rotated")
 
+        # The window content has been laid out to fill the space available after the
+        # rotation.
+        assert main_window.content.layout.width == pytest.approx(
+            main_window_probe.content_size[0], abs=1
+        )
+        assert main_window.content.layout.height == pytest.approx(
+            main_window_probe.content_size[1], abs=1
+        )
+
 else:
     ####################################################################################
     # Desktop platform tests
@@ -14,6 +14,8 @@ import toga
 from toga.colors import CORNFLOWERBLUE, GOLDENROD, REBECCAPURPLE
 from toga.style.pack import COLUMN, Pack
 
+from .conftest import xfail_on_platforms
+
 
 def window_probe(app, window):
     module = import_module("tests_backend.window")
@@ -69,6 +71,26 @@ if toga.platform.current_platform in {"iOS", "android"}:
         await main_window_probe.wait_for_window("Window.close is a no-op")
         assert main_window.visible
 
+    async def test_title_navigation(main_window, main_window_probe):
+        """The window title follows the view shown by the navigation controller"""
+        xfail_on_platforms("android")
+        original_title = main_window.title
+        try:
+            main_window.title = "A Different Title"
+            assert main_window.title == "A Different Title"
+
+            # Showing a different view changes the title
+            await main_window_probe.push_view("A Pushed Title")
+            assert main_window.title == "A Pushed Title"
+
+            # Returning to the window content restores the window title
+            await main_window_probe.pop_view()
+            assert main_window.title == "A Different Title"
+        finally:
+            main_window.title = original_title
+            assert main_window.title == "Toga Testbed"
+            await main_window_probe.wait_for_window("Window title can be reverted")
+
     async def test_secondary_window():
         """A secondary window cannot be created"""
         with pytest.raises(